@@ -1,5 +1,6 @@
 # boot.py
 import machine
+import os
 import gc
 import time
 import _thread
@@ -15,6 +16,51 @@ def load_wifi_credentials():
             print("Connecting saved WiFi...")
     except: pass
     
+UPDATE_ROOT = "/"  # main.py ile aynı
+UPDATE_TRIAL_MS = 60000  # yeni sürüm bu sürede shell'e ulaşmazsa reset
+
+def update_rollback(lines):
+    # "name": .bak varsa geri koy (yoksa hiç swap edilmemiş, dokunma)
+    # "+name": update'in eklediği dosya, sil
+    for entry in lines[2:]:
+        if entry.startswith("+"):
+            try: os.remove(UPDATE_ROOT + entry[1:])
+            except: pass
+            continue
+        path = UPDATE_ROOT + entry
+        try:
+            os.stat(path + ".bak")
+        except:
+            continue
+        os.rename(path + ".bak", path)
+    os.remove(UPDATE_ROOT + "update.state")
+
+def update_check():
+    # main.py'deki update() ile ortak durum dosyası
+    state = UPDATE_ROOT + "update.state"
+    try:
+        with open(state) as f:
+            lines = f.read().split("\n")
+    except:
+        return
+
+    if lines[0] == "pending":
+        # yeni sürümün ilk açılışı: shell'e ulaşırsa main.py onaylar
+        lines[0] = "trial"
+        with open(state + ".tmp", "w") as f:
+            f.write("\n".join(lines))
+        os.rename(state + ".tmp", state)
+        print("[update] trying new release", lines[1])
+        # takılır ya da REPL'e düşerse reset at, sonraki açılış geri alır
+        machine.Timer(0).init(mode=machine.Timer.ONE_SHOT, period=UPDATE_TRIAL_MS,
+                              callback=lambda t: machine.reset())
+        return
+
+    # "swapping": swap yarıda kaldı; "trial": yeni sürüm shell'e ulaşamadı
+    update_rollback(lines)
+    print("[update] new release failed, rolled back")
+    machine.reset()
+
 def freq_load():
     try:
         with open("freq.txt", "r") as f:
@@ -40,6 +86,8 @@ def blink(times, delay=0.3):
 
 
 
+update_check()
+
 ntptime.settime()
 print("Time synced:", time.localtime())
 
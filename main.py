@@ -3,6 +3,7 @@ from micropython import const
 from machine import Pin
 import network
 import os
+import sys
 import machine
 import gc
 import time
@@ -28,26 +29,92 @@ boot_time = time.ticks_ms()
 
 # ================= MicroPython =====================
 
-def cmd_run(args):
+RUN_CACHE = {}  # abs path -> (mtime, size, code, cost)
+RUN_LRU = []    # en eski başta
+RUN_CACHE_BYTES = 16 * 1024  # kaynak boyutu üzerinden tahmini bütçe
+RUN_MIN_FREE = 32 * 1024     # heap bunun altına inerse cache boşalt
+
+
+def run_cache_trim():
+    total = sum(RUN_CACHE[k][3] for k in RUN_LRU)
+    while RUN_LRU and (total > RUN_CACHE_BYTES or gc.mem_free() < RUN_MIN_FREE):
+        total -= RUN_CACHE.pop(RUN_LRU.pop(0))[3]
+        gc.collect()
+
+
+def run_compile(filename):
+    path = fs_abspath(filename)
+    st = os.stat(path)
+    hit = RUN_CACHE.get(path)
+    if hit and hit[0] == st[8] and hit[1] == st[6]:
+        RUN_LRU.remove(path)
+        RUN_LRU.append(path)
+        return hit[2]
+
+    with open(path, "r") as f:
+        code = compile(f.read(), filename, "exec")
+    if path in RUN_CACHE:
+        RUN_LRU.remove(path)
+    RUN_CACHE[path] = (st[8], st[6], code, st[6])
+    RUN_LRU.append(path)
+    run_cache_trim()
+    return code
+
+
+class ScriptAPI:
+    # run ile çalışan scriptlerin gördüğü tek shell arayüzü
+    def __init__(self, argv, printer):
+        self.argv = argv
+        self.print = printer
+        self.vars = SHELL_VARS
+        self.wlan = wlan
+        self.led = led
+        self.gpio = gpio
+        self.pwm = pwm
+        self.blink = blink
+
+    def shell(self, cmd):
+        return shell_exec(cmd, self.print)
+
+
+def cmd_run(args, printer=print):
     if len(args) < 2:
-        print("Usage: run <script.py>")
+        printer("Usage: run <script.py> [args...]")
         return
 
     filename = args[1]
     try:
-        with open(filename, "r") as f:
-            code = f.read()
-        print(f"Running {filename}...\n")
-        exec(code, globals(), globals())
-        print(f"\nFinished {filename}")
+        code = run_compile(filename)
+        argv = args[1:]
+        api = ScriptAPI(argv, printer)
+        env = {"__name__": "__main__", "argv": argv, "print": printer, "espos": api}
+        printer(f"Running {filename}...\n")
+
+        gc.collect()
+        free = gc.mem_free()
+        t = time.ticks_ms()
+        prev = sys.modules.get("espos")  # iç içe run (espos.shell("run ..."))
+        sys.modules["espos"] = api  # scriptlerde `import espos` çalışsın
+        try:
+            exec(code, env)
+        finally:
+            if prev is None: sys.modules.pop("espos", None)
+            else: sys.modules["espos"] = prev
+            fs_cache_clear()
+        ms = time.ticks_diff(time.ticks_ms(), t)
+        used = free - gc.mem_free()
+        del env, api
+        gc.collect()
+        printer(f"\nFinished {filename} in {ms} ms, heap used {used} bytes, retained {free - gc.mem_free()} bytes")
     except Exception as e:
-        print("Error:", e)
+        printer("Error:", e)
 
 
 
 # ================= Plugins / PKG ===================
 
 PKG_REPO = "https://raw.githubusercontent.com/Gubir34/esp-os-packages/main/"
+PKG_KEEP_COMPRESSED = True  # .espos.z paketleri sıkıştırılmış sakla, yüklerken aç
 
 PLUGINS = {}
 INSTALLING = set()
@@ -62,58 +129,105 @@ def parse_dependencies(code):
     return deps
 
 
-def pkg_exists(name):
+def pkg_files():
+    # name -> dosya adı, düz .espos sıkıştırılmış .espos.z'den önce gelir
+    files = {}
     try:
-        return name + ".espos" in os.listdir("pkg")
+        for e in fs_scan("pkg"):
+            f = e[0]
+            if f.endswith(".espos"): files[f[:-6]] = f
+            elif f.endswith(".espos.z"): files.setdefault(f[:-8], f)
     except:
-        return False
+        pass
+    return files
+
 
+def pkg_names():
+    return list(pkg_files())
 
-def resolve_dependencies(code):
+
+def pkg_exists(name):
+    return name in pkg_names()
+
+
+def resolve_dependencies(code, printer=print):
     deps = parse_dependencies(code)
     for dep in deps:
         if not pkg_exists(dep):
-            print("[pkg] installing dependency:", dep)
-            pkg_install_from_repo(dep)
-
+            printer("[pkg] installing dependency:", dep)
+            pkg_install_from_repo(dep, printer)
 
-def pkg_install_from_repo(name):
-    url = PKG_REPO + name + ".py"
-    print("[pkg] downloading:", url)
 
-    try:
-        r = urequests.get(url)
+def pkg_install_from_repo(name, printer=print):
+    # önce sıkıştırılmış paketi dene, yoksa düz kaynağa düş
+    for ext in (".espos.z", ".py"):
+        url = PKG_REPO + name + ext
 
-        if r.status_code != 200:
-            print("[pkg] download failed:", r.status_code)
-            r.close()
-            return
+        try:
+            r = urequests.get(url)
 
-        code = r.text
-        r.close()
+            if r.status_code != 200:
+                r.close()
+                # sıkıştırılmış sürüm yoksa sessizce düz kaynağa geç
+                if ext == ".py":
+                    printer("[pkg] download failed:", r.status_code, url)
+                continue
 
-        with open("pkg/" + name + ".py", "w") as f:
-            f.write(code)
+            printer("[pkg] downloading:", url)
 
-        print("[pkg] installed:", name)
-        load_plugins()
+            if ext == ".espos.z" and PKG_KEEP_COMPRESSED:
+                dest, src = "pkg/" + name + ".espos.z", r.raw
+            elif ext == ".espos.z":
+                dest, src = "pkg/" + name + ".espos", z_reader(r.raw)
+            else:
+                dest, src = "pkg/" + name + ".espos", r.raw
 
-    except Exception as e:
-        print("[pkg] install error:", e)
+            # geçici dosyaya indir, sadece tamamlanınca eskisinin yerine koy
+            tmp = dest + ".part"
+            try:
+                with open(tmp, "wb") as f:
+                    size = copy_stream(src, f)
+            except:
+                try: os.remove(tmp)
+                except: pass
+                raise
+            finally:
+                r.close()
+
+            old = pkg_files().get(name)
+            os.rename(tmp, dest)
+            if old and "pkg/" + old != dest:
+                os.remove("pkg/" + old)
+                fs_invalidate("pkg/" + old)
+            fs_invalidate(dest)
+
+            printer("[pkg] installed:", name, "({} bytes)".format(size))
+            load_plugins(printer)
+
+        except Exception as e:
+            printer("[pkg] install error:", e)
+        return
 
 
 
-def load_plugins():
+def load_plugins(printer=print):
     PLUGINS.clear()
     try:
-        for f in os.listdir("pkg"):
-            if f.endswith(".espos"):
-                name = f[:-6]
-                with open("pkg/" + f, "r") as fp:
-                    PLUGINS[name] = fp.read()
-                print("[pkg] loaded:", name)
+        for name, f in pkg_files().items():
+            with open("pkg/" + f, "rb") as fp:
+                if f.endswith(".z"): PLUGINS[name] = z_reader(fp).read().decode()
+                else: PLUGINS[name] = fp.read().decode()
+            printer("[pkg] loaded:", name)
     except Exception as e:
-        print("[pkg] load error:", e)
+        printer("[pkg] load error:", e)
+
+
+def plugin_env():
+    env = {}
+    # tüm pluginleri aynı namespace'e yükle
+    for p in PLUGINS:
+        exec(PLUGINS[p], {}, env)
+    return env
 
 
 def run_plugin(name, args, printer=print):
@@ -122,11 +236,7 @@ def run_plugin(name, args, printer=print):
         return
 
     try:
-        env = {}
-
-        # tüm pluginleri aynı namespace'e yükle
-        for p in PLUGINS:
-            exec(PLUGINS[p], {}, env)
+        env = plugin_env()
 
         if "main" in env:
             env["main"](args, printer)
@@ -135,28 +245,31 @@ def run_plugin(name, args, printer=print):
 
     except Exception as e:
         printer("Plugin error:", e)
+    finally:
+        fs_cache_clear()
 
 
 # ---------- shell entegrasyonu ----------
-def shell_pkg_command(c, a):
+def shell_pkg_command(c, a, printer=print):
     if c == "pkg" and a:
         if a[0] == "install" and len(a) > 1:
-            pkg_install_from_repo(a[1])
+            pkg_install_from_repo(a[1], printer)
             return True
 
         elif a[0] == "list":
-            for f in os.listdir("pkg"):
-                if f.endswith(".espos"):
-                    print("-", f[:-6])
+            for name in pkg_names():
+                printer("-", name)
             return True
 
         elif a[0] == "remove" and len(a) > 1:
             try:
-                os.remove("pkg/" + a[1] + ".espos")
-                print("[pkg] removed:", a[1])
-                load_plugins()
+                f = "pkg/" + pkg_files().get(a[1], a[1] + ".espos")
+                os.remove(f)
+                fs_invalidate(f)
+                printer("[pkg] removed:", a[1])
+                load_plugins(printer)
             except Exception as e:
-                print("[pkg] remove error:", e)
+                printer("[pkg] remove error:", e)
             return True
 
     return False
@@ -272,25 +385,25 @@ def run_shell_script(filename, printer=print):
         i += 1
 
 
-def gpio(pin, val):
+def gpio(pin, val, printer=print):
     try:
         p = Pin(int(pin), Pin.OUT)
         p.value(int(val))
-        print(f"GPIO {pin} = {val}")
+        printer(f"GPIO {pin} = {val}")
     except Exception as e:
-        print("GPIO error:", e)
+        printer("GPIO error:", e)
 
 
 
-def pwm(pin, freq, duty):
+def pwm(pin, freq, duty, printer=print):
     try:
         p = Pin(int(pin), Pin.OUT)
         pwm_obj = machine.PWM(p)
         pwm_obj.freq(int(freq))
         pwm_obj.duty_u16(int(duty))
-        print(f"PWM on pin {pin} freq={freq}Hz duty={duty}")
+        printer(f"PWM on pin {pin} freq={freq}Hz duty={duty}")
     except Exception as e:
-        print("PWM error:", e)
+        printer("PWM error:", e)
 
 
 def spinner_loader(turns=3, delay=0.15):
@@ -319,6 +432,7 @@ def blink(times, delay=0.3):
 def freq_save(freq):
     with open("freq.txt", "w") as f:
         f.write(str(freq))
+    fs_invalidate("freq.txt")
 
 def freq_load():
     try:
@@ -328,88 +442,309 @@ def freq_load():
     except Exception:
         pass
 
-def freq_change(mhz):
+def freq_change(mhz, printer=print):
     table = {80: 80_000_000, 160: 160_000_000, 240: 240_000_000}
     if mhz in table:
         machine.freq(table[mhz])
         freq_save(table[mhz])
-        print("CPU set to", mhz, "MHz")
+        printer("CPU set to", mhz, "MHz")
     else:
-        print("Use: 80 / 160 / 240")
+        printer("Use: 80 / 160 / 240")
 
 # ================= File Operations =================
 
-def mv(src, dest):
+def mv(src, dest, printer=print):
     try:
         os.rename(src, dest)
-        print(f"{src} moved to {dest}")
+        fs_invalidate(src); fs_invalidate(dest)
+        printer(f"{src} moved to {dest}")
     except Exception as e:
-        print("Move error:", e)
+        printer("Move error:", e)
         
-def cp(src, dest):
+def cp(src, dest, printer=print):
     try:
         with open(src, "r") as fsrc, open(dest, "w") as fdest:
             fdest.write(fsrc.read())
-        print(f"{src} copied to {dest}")
+        fs_invalidate(dest)
+        printer(f"{src} copied to {dest}")
     except Exception as e:
-        print("Copy error:", e)
+        printer("Copy error:", e)
 
 
-def mkdir(path):
+def mkdir(path, printer=print):
     try:
         os.mkdir(path)
-        print(f"Directory '{path}' created")
+        fs_invalidate(path)
+        printer(f"Directory '{path}' created")
     except Exception as e:
-        print("mkdir error:", e)
+        printer("mkdir error:", e)
 
-def rmdir(path):
+def rmdir(path, printer=print):
     try:
         os.rmdir(path)
-        print(f"Directory '{path}' removed")
+        fs_invalidate(path)
+        printer(f"Directory '{path}' removed")
     except Exception as e:
-        print("rmdir error:", e)
+        printer("rmdir error:", e)
 
 
-def create_file(filename):
+def create_file(filename, printer=print):
     try:
         with open(filename, "w", encoding="utf-8") as f: f.write("")
-        print(f"File '{filename}' created")
-    except Exception as e: print("Error:", e)
+        fs_invalidate(filename)
+        printer(f"File '{filename}' created")
+    except Exception as e: printer("Error:", e)
 
-def write_file(filename, content):
+def write_file(filename, content, printer=print):
     try:
         with open(filename, "w", encoding="utf-8") as f: f.write(content)
-        print(f"Written to '{filename}': {content}")
-    except Exception as e: print("Error:", e)
+        fs_invalidate(filename)
+        printer(f"Written to '{filename}': {content}")
+    except Exception as e: printer("Error:", e)
 
-def append_file(filename, content):
+def append_file(filename, content, printer=print):
     try:
         with open(filename, "a", encoding="utf-8") as f: f.write(content)
-        print(f"Appended to '{filename}': {content}")
-    except Exception as e: print("Error:", e)
+        fs_invalidate(filename)
+        printer(f"Appended to '{filename}': {content}")
+    except Exception as e: printer("Error:", e)
 
-def read_file(filename):
+def read_file(filename, printer=print):
+    # satır satır: büyük dosyalar RAM'e alınmaz, pipeline'a akar
     try:
-        with open(filename, "r", encoding="utf-8") as f: print(f.read())
-    except Exception as e: print("Error:", e)
+        line = ""
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f: printer(line, end="")
+        if not line.endswith("\n"): printer()
+    except Exception as e: printer("Error:", e)
 
-def delete_file(filename):
+def delete_file(filename, printer=print):
     try:
         os.remove(filename)
-        print(f"File '{filename}' deleted")
-    except Exception as e: print("Error:", e)
+        fs_invalidate(filename)
+        printer(f"File '{filename}' deleted")
+    except Exception as e: printer("Error:", e)
 
-def flash_info():
+def flash_info(printer=print):
     stats = os.statvfs("/")
     block_size = stats[0]
     total_blocks = stats[2]
     free_blocks = stats[3]
-    print("Total flash:", block_size*total_blocks, "bytes")
-    print("Free flash:", block_size*free_blocks, "bytes")
+    printer("Total flash:", block_size*total_blocks, "bytes")
+    printer("Free flash:", block_size*free_blocks, "bytes")
+
+# ================= Compression =================
+try:
+    import deflate
+except ImportError:
+    deflate = None  # eski firmware: sadece zlib ile açma
+
+Z_WBITS = 9  # 512 byte pencere, açarken de az RAM ister
+
+def z_reader(stream, fmt="zlib"):
+    if deflate:
+        return deflate.DeflateIO(stream, deflate.GZIP if fmt == "gzip" else deflate.ZLIB)
+    import zlib
+    return zlib.DecompIO(stream, 31 if fmt == "gzip" else Z_WBITS)
+
+def z_writer(stream, fmt="zlib"):
+    if not deflate:
+        raise OSError("compression not supported on this firmware")
+    return deflate.DeflateIO(stream, deflate.GZIP if fmt == "gzip" else deflate.ZLIB, Z_WBITS)
+
+def copy_stream(src, dst, chunk=512, hasher=None):
+    buf = bytearray(chunk)
+    mv = memoryview(buf)
+    total = 0
+    while True:
+        n = src.readinto(buf)
+        if not n: break
+        dst.write(mv[:n])
+        if hasher: hasher.update(mv[:n])
+        total += n
+    return total
+
+def write_via_part(dest, fill):
+    # fill(f) dest.part'a yazar, sadece başarılıysa dest'in yerine konur
+    tmp = dest + ".part"
+    try:
+        with open(tmp, "wb") as f:
+            result = fill(f)
+        os.rename(tmp, dest)
+        return result
+    except:
+        try: os.remove(tmp)
+        except: pass
+        raise
+    finally:
+        fs_invalidate(dest)
+
+def gzip_file(filename, printer=print):
+    def fill(f):
+        with open(filename, "rb") as src:
+            z = z_writer(f, "gzip")
+            size = copy_stream(src, z)
+            z.close()
+        return size
+
+    try:
+        size = write_via_part(filename + ".gz", fill)
+        os.remove(filename)
+        fs_invalidate(filename)
+        printer(f"{filename} -> {filename}.gz ({size} -> {os.stat(filename + '.gz')[6]} bytes)")
+    except Exception as e: printer("gzip error:", e)
+
+def gunzip_file(filename, printer=print):
+    if not filename.endswith(".gz"):
+        printer("gunzip: expected .gz file"); return
+    dest = filename[:-3]
+
+    def fill(f):
+        with open(filename, "rb") as src:
+            return copy_stream(z_reader(src, "gzip"), f)
+
+    try:
+        size = write_via_part(dest, fill)
+        os.remove(filename)
+        fs_invalidate(filename)
+        printer(f"{filename} -> {dest} ({size} bytes)")
+    except Exception as e: printer("gunzip error:", e)
+
+def zbench(filename, printer=print):
+    # düz ve sıkıştırılmış okumanın boyut/süre karşılaştırması
+    tmp = filename + ".zb"
+    try:
+        with open(filename, "rb") as src, open(tmp, "wb") as f:
+            z = z_writer(f)
+            raw = copy_stream(src, z)
+            z.close()
+        packed = os.stat(tmp)[6]
+
+        t = time.ticks_us()
+        with open(filename, "rb") as f: f.read()
+        t_raw = time.ticks_diff(time.ticks_us(), t)
+
+        t = time.ticks_us()
+        with open(tmp, "rb") as f: z_reader(f).read()
+        t_z = time.ticks_diff(time.ticks_us(), t)
+
+        printer("Size: {} -> {} bytes ({}%)".format(raw, packed, packed * 100 // max(raw, 1)))
+        printer("Load: plain {} us, compressed {} us".format(t_raw, t_z))
+    except Exception as e: printer("zbench error:", e)
+    finally:
+        try: os.remove(tmp)
+        except: pass
 
 # ================= File System =================
-def ls(): print(os.listdir())
-def pwd(): print(os.getcwd())
+FS_CACHE = {}  # abs dir path -> [(name, type, size), ...]
+FS_LRU = []    # en eski başta
+FS_CACHE_DIRS = 16  # en fazla bu kadar klasör tutulur
+FS_DIR = 0x4000
+
+def fs_abspath(path=""):
+    if not path.startswith("/"):
+        path = os.getcwd() + "/" + path
+    parts = []
+    for p in path.split("/"):
+        if p in ("", "."): continue
+        if p == "..":
+            if parts: parts.pop()
+        else: parts.append(p)
+    return "/" + "/".join(parts)
+
+def fs_join(path, name):
+    return path.rstrip("/") + "/" + name
+
+def fs_scan(path=""):
+    path = fs_abspath(path)
+    entries = FS_CACHE.get(path)
+    if entries is not None:
+        if FS_LRU[-1] != path:
+            FS_LRU.remove(path)
+            FS_LRU.append(path)
+    else:
+        entries = []
+        for e in os.ilistdir(path):
+            name, kind = e[0], e[1]
+            if kind == FS_DIR: size = 0
+            elif len(e) > 3 and e[3] >= 0: size = e[3]
+            else: size = os.stat(fs_join(path, name))[6]
+            entries.append((name, kind, size))
+        FS_CACHE[path] = entries
+        FS_LRU.append(path)
+        while len(FS_LRU) > FS_CACHE_DIRS:
+            del FS_CACHE[FS_LRU.pop(0)]
+    return entries
+
+def fs_cache_clear():
+    FS_CACHE.clear()
+    del FS_LRU[:]
+
+def fs_invalidate(path):
+    # dosyanın klasörünü ve (klasörse) kendisini + alt klasörleri unut
+    path = fs_abspath(path)
+    parent = path.rsplit("/", 1)[0] or "/"
+    for p in list(FS_LRU):
+        if p == parent or p == path or p.startswith(path + "/"):
+            del FS_CACHE[p]
+            FS_LRU.remove(p)
+
+def fs_match(pattern, name):
+    # basit glob: * ve ?
+    p = n = 0
+    star, mark = -1, 0
+    while n < len(name):
+        if p < len(pattern) and pattern[p] in ("?", name[n]):
+            p += 1; n += 1
+        elif p < len(pattern) and pattern[p] == "*":
+            star, mark = p, n
+            p += 1
+        elif star >= 0:
+            p = star + 1
+            mark += 1
+            n = mark
+        else:
+            return False
+    while p < len(pattern) and pattern[p] == "*":
+        p += 1
+    return p == len(pattern)
+
+def fs_du(path):
+    total = 0
+    for name, kind, size in fs_scan(path):
+        if kind == FS_DIR: total += fs_du(fs_join(path, name))
+        else: total += size
+    return total
+
+def fs_find(pattern, path, printer=print):
+    for name, kind, size in fs_scan(path):
+        full = fs_join(path, name)
+        if fs_match(pattern, name): printer(full)
+        if kind == FS_DIR: fs_find(pattern, full, printer)
+
+def ls(args=(), printer=print):
+    long = "-l" in args
+    paths = [a for a in args if a != "-l"]
+    try:
+        entries = fs_scan(paths[0] if paths else "")
+    except Exception as e:
+        printer("ls error:", e); return
+    if not long:
+        printer([e[0] for e in entries]); return
+    for name, kind, size in entries:
+        printer("{} {:>8} {}".format("d" if kind == FS_DIR else "-", size, name))
+
+def du(path="", printer=print):
+    try:
+        printer(fs_du(fs_abspath(path)), "bytes", fs_abspath(path))
+    except Exception as e: printer("du error:", e)
+
+def find(pattern, path="", printer=print):
+    try:
+        fs_find(pattern, fs_abspath(path), printer)
+    except Exception as e: printer("find error:", e)
+
+def pwd(printer=print): printer(os.getcwd())
 def cd(path): os.chdir(path)
 
 # ================= WiFi =================
@@ -418,52 +753,153 @@ def wifi_off(): wlan.active(False)
 
 import usocket as socket
 
-def ping(host):
+NETBENCH_PORT = 5210  # tools/netbench_server.py
+
+def ping(host, count=4, port=80, printer=print):
+    # ICMP yok: RTT = TCP connect süresi
+    if count < 1:
+        printer("Ping error: count must be >= 1")
+        return
     try:
-        addr = socket.getaddrinfo(host, 80)[0][-1][0]
-        print(f"Pinging {host} [{addr}] ...")
+        t = time.ticks_us()
+        addr = socket.getaddrinfo(host, port)[0][-1]
+        dns_first = time.ticks_diff(time.ticks_us(), t)
+        t = time.ticks_us()
+        socket.getaddrinfo(host, port)
+        dns_repeat = time.ticks_diff(time.ticks_us(), t)
+    except Exception as e:
+        printer("Ping error:", e)
+        return
+
+    printer(f"Pinging {host} [{addr[0]}] port {port}")
+    printer("DNS: {:.2f} ms (repeat {:.2f} ms)".format(dns_first / 1000, dns_repeat / 1000))
+
+    rtts = []
+    for i in range(count):
         s = socket.socket()
-        s.connect((addr, 80))
-        print("Ping success")
+        s.settimeout(2)
+        try:
+            t = time.ticks_us()
+            s.connect(addr)
+            rtt = time.ticks_diff(time.ticks_us(), t)
+            rtts.append(rtt)
+            printer("seq={} time={:.2f} ms".format(i, rtt / 1000))
+        except Exception as e:
+            printer("seq={} failed: {}".format(i, e))
+        finally:
+            s.close()
+        if i < count - 1: time.sleep(0.2)
+
+    printer("{} sent, {} ok, {}% loss".format(count, len(rtts), (count - len(rtts)) * 100 // count))
+    if rtts:
+        jitter = 0
+        for a, b in zip(rtts, rtts[1:]): jitter += abs(b - a)
+        jitter = jitter / (len(rtts) - 1) if len(rtts) > 1 else 0
+        printer("rtt min/avg/max/jitter = {:.2f}/{:.2f}/{:.2f}/{:.2f} ms".format(
+            min(rtts) / 1000, sum(rtts) / len(rtts) / 1000, max(rtts) / 1000, jitter / 1000))
+
+def netbench_run(addr, mode, total, bufsize):
+    # sunucu protokolü: "down N\n" -> N byte gönderir,
+    # "up N\n" -> N byte okur ve "ok N\n" ile onaylar (süre onaya kadar)
+    buf = bytearray(bufsize)
+    mv = memoryview(buf)
+    s = socket.socket()
+    s.settimeout(5)
+    try:
+        s.connect(addr)
+        s.send("{} {}\n".format(mode, total).encode())
+        done = 0
+        t = time.ticks_us()
+        if mode == "down":
+            while done < total:
+                n = s.readinto(buf)
+                if not n: break
+                done += n
+        else:
+            while done < total:
+                n = min(bufsize, total - done)
+                s.write(mv[:n])
+                done += n
+            ack = b""
+            while not ack.endswith(b"\n"):
+                c = s.recv(16)
+                if not c: raise OSError("no ack from server")
+                ack += c
+            done = int(ack.split()[1])
+        us = time.ticks_diff(time.ticks_us(), t)
+    finally:
         s.close()
+    return done, us
+
+def netbench(host, port=NETBENCH_PORT, bufsizes=(1024,), kbytes=64, printer=print):
+    if kbytes < 1 or min(bufsizes) < 1:
+        printer("netbench error: buffer size and -n must be >= 1")
+        return
+    try:
+        addr = socket.getaddrinfo(host, port)[0][-1]
     except Exception as e:
-        print("Ping error:", e)
+        printer("netbench error:", e)
+        return
+    printer(f"netbench {host}:{port} {kbytes} KB per run")
+    for bufsize in bufsizes:
+        for mode in ("down", "up"):
+            try:
+                done, us = netbench_run(addr, mode, kbytes * 1024, bufsize)
+                printer("{:>4} buf={:<5} {} bytes in {:.1f} ms = {:.1f} KB/s".format(
+                    mode, bufsize, done, us / 1000, done * 1000000 / 1024 / max(us, 1)))
+            except Exception as e:
+                printer("{:>4} buf={:<5} error: {}".format(mode, bufsize, e))
 
-def ip():
+def parse_opts(args, opts):
+    # "-c 5 host" -> ({"-c": "5"}, ["host"])
+    found, rest = {}, []
+    i = 0
+    while i < len(args):
+        if args[i] in opts and i + 1 < len(args):
+            found[args[i]] = args[i + 1]
+            i += 2
+        else:
+            rest.append(args[i])
+            i += 1
+    return found, rest
+
+def ip(printer=print):
     if wlan.isconnected():
-        print("IP:", wlan.ifconfig()[0])
+        printer("IP:", wlan.ifconfig()[0])
     else:
-        print("WiFi not connected")
+        printer("WiFi not connected")
 
-def download(url, filename):
+def download(url, filename, printer=print):
     try:
         r = urequests.get(url)
         with open(filename, "w") as f:
             f.write(r.text)
         r.close()
-        print(f"Downloaded {url} -> {filename}")
+        fs_invalidate(filename)
+        printer(f"Downloaded {url} -> {filename}")
     except Exception as e:
-        print("Download error:", e)
+        printer("Download error:", e)
 
 
-def wifi_connect(ssid, password):
+def wifi_connect(ssid, password, printer=print):
     wlan.active(True)
     wlan.connect(ssid, password)
 
     for _ in range(10):
         if wlan.isconnected():
-            print("\nConnected:", wlan.ifconfig())
+            printer("\nConnected:", wlan.ifconfig())
             save_wifi_credentials(ssid, password)
             return
-        print(".", end="")
+        printer(".", end="")
         time.sleep(1)
 
-    print("\nConnection failed")
+    printer("\nConnection failed")
 
 
 def save_wifi_credentials(ssid, password):
     try:
         with open("wifi.txt", "w") as f: f.write(f"{ssid}\n{password}")
+        fs_invalidate("wifi.txt")
     except: pass
 
 
@@ -534,6 +970,157 @@ def http_time_sync(printer=print):
         return False
 
 
+# ================= OTA Update =================
+
+import hashlib
+import ubinascii
+
+UPDATE_URL = "https://raw.githubusercontent.com/Gubir34/ESPOS/main/"
+UPDATE_ROOT = "/"  # tüm yollar buna göre: cd/netshell cwd'si etkilemez, testler değiştirir
+UPDATE_DIR = "update"
+UPDATE_STATE = "update.state"  # boot.py ile ortak, bkz. update_write_state
+UPDATE_TIMER = 0  # boot.py'nin trial zamanlayıcısı, onaylanınca durdurulur
+
+def update_path(name):
+    return UPDATE_ROOT + name
+
+def current_version():
+    try:
+        with open(update_path("version.txt")) as f: return f.read().strip()
+    except: return None
+
+def update_cleanup():
+    staging = update_path(UPDATE_DIR)
+    try:
+        for name in os.listdir(staging):
+            os.remove(staging + "/" + name)
+        os.rmdir(staging)
+    except: pass
+    fs_invalidate(staging)
+
+def update_staged(name):
+    return update_path(UPDATE_DIR) + "/" + name.replace("/", "__")
+
+def update_write_state(state, version, entries):
+    # satır 1: swapping/pending/trial, satır 2: sürüm, sonra dosyalar:
+    # "name" = önceden vardı (.bak'tan geri alınır), "+name" = yeni dosya
+    path = update_path(UPDATE_STATE)
+    with open(path + ".tmp", "w") as f:
+        f.write(state + "\n" + (version or "") + "\n" + "\n".join(entries))
+    os.rename(path + ".tmp", path)
+
+def update_fetch(url, path, sha256):
+    h = hashlib.sha256()
+    r = urequests.get(url)
+    try:
+        if r.status_code != 200:
+            raise OSError("HTTP {}".format(r.status_code))
+        with open(path, "wb") as f:
+            size = copy_stream(r.raw, f, 1024, h)
+    finally:
+        r.close()
+    if ubinascii.hexlify(h.digest()).decode() != sha256.lower():
+        raise ValueError("sha256 mismatch: " + url)
+    return size
+
+def update(url=UPDATE_URL, printer=print):
+    base = url if url.endswith("/") else url + "/"
+    try:
+        r = urequests.get(base + "manifest.json")
+        if r.status_code != 200:
+            printer("[update] manifest failed:", r.status_code)
+            r.close()
+            return
+        manifest = r.json()
+        r.close()
+    except Exception as e:
+        printer("[update] manifest error:", e)
+        return
+
+    version = manifest.get("version")
+    if version and version == current_version():
+        printer("[update] already up to date:", version)
+        return
+    printer("[update] release", version)
+
+    # 1) staging klasörüne parça parça indir ve doğrula
+    update_cleanup()
+    names = []
+    try:
+        os.mkdir(update_path(UPDATE_DIR))
+        for entry in manifest["files"]:
+            name = entry["name"].lstrip("/")
+            size = update_fetch(entry.get("url", base + name),
+                                update_staged(name), entry["sha256"])
+            printer("[update] verified:", name, "({} bytes)".format(size))
+            names.append(name)
+    except Exception as e:
+        printer("[update] download error:", e)
+        update_cleanup()
+        return
+
+    # 2) eski yedekleri sil ve hangi dosyaların önceden var olduğunu kaydet;
+    #    "swapping" durumunda elektrik giderse boot.py hemen geri alır
+    entries = []
+    for name in names:
+        path = update_path(name)
+        try: os.remove(path + ".bak")
+        except: pass
+        try:
+            os.stat(path)
+            entries.append(name)
+        except OSError:
+            entries.append("+" + name)
+    update_write_state("swapping", version, entries)
+
+    # 3) her dosya os.rename ile atomik olarak yer değiştirir
+    moved = []  # (path, yedeği var mı)
+    try:
+        for entry in entries:
+            path = update_path(entry.lstrip("+"))
+            backup = not entry.startswith("+")
+            if backup: os.rename(path, path + ".bak")
+            moved.append((path, backup))
+            os.rename(update_staged(entry.lstrip("+")), path)
+            fs_invalidate(path)
+    except Exception as e:
+        # yarım kalan swap'ı geri al, boot.py karışık sürümü denemesin
+        printer("[update] swap error:", e, "- restoring")
+        for path, backup in moved:
+            try:
+                if backup: os.rename(path + ".bak", path)
+                else: os.remove(path)
+            except: pass
+        os.remove(update_path(UPDATE_STATE))
+        update_cleanup()
+        fs_cache_clear()
+        return
+
+    # 4) tüm dosyalar yerinde: ancak şimdi yeni sürüm denenebilir
+    update_write_state("pending", version, entries)
+    update_cleanup()
+    printer("[update] installed, rebooting...")
+    reboot()
+
+def update_confirm(printer=print):
+    # shell prompt'a ulaşıldı: yeni sürüm sağlam, yedekleri sil
+    try:
+        with open(update_path(UPDATE_STATE)) as f:
+            lines = f.read().split("\n")
+    except:
+        return
+    if lines[0] != "trial":
+        return
+    machine.Timer(UPDATE_TIMER).deinit()
+    for entry in lines[2:]:
+        try: os.remove(update_path(entry.lstrip("+")) + ".bak")
+        except: pass
+    if lines[1]:
+        with open(update_path("version.txt"), "w") as f: f.write(lines[1])
+    os.remove(update_path(UPDATE_STATE))
+    fs_cache_clear()
+    printer("[update] release confirmed:", lines[1])
+
 # ================= Games ===================
 
 import urandom
@@ -557,18 +1144,220 @@ def number_game():
 
 
 # ================= Weather =================
-def get_weather(city):
+def get_weather(city, printer=print):
     if not wlan.isconnected():
-        print("WiFi not connected")
+        printer("WiFi not connected")
         return
     url = f"http://api.openweathermap.org/data/2.5/weather?q={city},TR&appid={OPEN_WEATHER_MAP_API}&units=metric&lang=en"
     try:
         r = urequests.get(url)
         data = r.json()
         r.close()
-        if "main" not in data: print("Weather API error"); return
-        print(f"City: {city}\nTemp: {data['main']['temp']} °C\nWeather: {data['weather'][0]['description']}\nHumidity: {data['main']['humidity']}%")
-    except Exception as e: print("Weather error:", e)
+        if "main" not in data: printer("Weather API error"); return
+        printer(f"City: {city}\nTemp: {data['main']['temp']} °C\nWeather: {data['weather'][0]['description']}\nHumidity: {data['main']['humidity']}%")
+    except Exception as e: printer("Weather error:", e)
+
+# ================= Pipelines =================
+# Her aşama bir generator: `line = yield` ile satır alır (None = akış bitti),
+# çıktıyı printer ile bir sonraki aşamaya iter. Pluginler `pipe(args, printer)`
+# tanımlayarak aşama olabilir.
+
+class LineSink:
+    # print() uyumlu printer, metni satırlara bölüp push'a verir
+    def __init__(self, push):
+        self.push = push
+        self.part = ""
+
+    def __call__(self, *args, sep=" ", end="\n"):
+        text = self.part + sep.join([str(a) for a in args]) + end
+        start = 0
+        while True:
+            i = text.find("\n", start)
+            if i < 0: break
+            self.push(text[start:i])
+            start = i + 1
+        self.part = text[start:]
+
+    def close(self):
+        if self.part:
+            self.push(self.part)
+            self.part = ""
+        self.push(None)
+
+
+class PipeStage:
+    # aşamadaki hatalar errors'a eklenir, run_pipeline asıl printer'a yazar
+    def __init__(self, fn, args, push, errors):
+        self.sink = LineSink(push)
+        self.errors = errors
+        self.done = False
+        try:
+            self.gen = fn(args, self.sink)
+            if not hasattr(self.gen, "send"):
+                raise TypeError("pipe stage must be a generator")
+            next(self.gen)
+        except StopIteration:
+            # satır beklemeden bitti (head -n 0)
+            self.finish()
+        except Exception as e:
+            self.finish(e)
+
+    def finish(self, error=None):
+        self.done = True
+        if error is not None:
+            self.errors.append(error)
+        self.sink.close()
+
+    def __call__(self, line):
+        if self.done:
+            return  # aşama bitti (head) ya da hata verdi, kalan satırları at
+        try:
+            self.gen.send(line)
+            if line is None:
+                self.gen.close()
+                raise StopIteration
+        except StopIteration:
+            self.finish()
+        except Exception as e:
+            self.finish(e)
+
+
+def pipe_grep(args, printer):
+    invert, icase = "-v" in args, "-i" in args
+    words = [a for a in args if a not in ("-v", "-i")]
+    pat = " ".join(words)
+    if icase: pat = pat.lower()
+    while True:
+        line = yield
+        if line is None: return
+        if (pat in (line.lower() if icase else line)) != invert:
+            printer(line)
+
+
+def pipe_head(args, printer):
+    n = int(parse_opts(args, ("-n",))[0].get("-n", 10))
+    while n > 0:
+        line = yield
+        if line is None: return
+        printer(line)
+        n -= 1
+
+
+def pipe_tail(args, printer):
+    n = int(parse_opts(args, ("-n",))[0].get("-n", 10))
+    last = []
+    while True:
+        line = yield
+        if line is None: break
+        last.append(line)
+        if len(last) > n: last.pop(0)
+    for line in last:
+        printer(line)
+
+
+def pipe_wc(args, printer):
+    lines = words = chars = 0
+    while True:
+        line = yield
+        if line is None: break
+        lines += 1
+        words += len(line.split())
+        chars += len(line) + 1
+    if "-l" in args: printer(lines)
+    else: printer(lines, words, chars)
+
+
+def pipe_sort(args, printer):
+    # sıralama doğası gereği tüm satırları tutar
+    lines = []
+    while True:
+        line = yield
+        if line is None: break
+        lines.append(line)
+    key = None
+    if "-n" in args:
+        def key(l):
+            try: return float(l.split()[0])
+            except: return 0
+    lines.sort(key=key, reverse="-r" in args)
+    for line in lines:
+        printer(line)
+
+
+PIPE_FILTERS = {"grep": pipe_grep, "head": pipe_head, "tail": pipe_tail,
+                "wc": pipe_wc, "sort": pipe_sort}
+
+
+def pipe_filter(name):
+    if name in PIPE_FILTERS:
+        return PIPE_FILTERS[name]
+    if name in PLUGINS:
+        # sadece bu pluginin kodu: başka pluginin pipe'ı karışmasın
+        env = {}
+        exec(PLUGINS[name], env)
+        return env.get("pipe")
+
+
+def run_pipeline(parts, printer=print):
+    target = None
+    for op in (">>", ">"):
+        if op in parts:
+            k = parts.index(op)
+            if k + 2 != len(parts):
+                printer("Syntax: <cmd> " + op + " <file>")
+                return
+            target, mode = parts[k + 1], "a" if op == ">>" else "w"
+            parts = parts[:k]
+            break
+
+    stages = [[]]
+    for p in parts:
+        if p == "|": stages.append([])
+        else: stages[-1].append(p)
+    if not all(stages):
+        printer("Syntax error: empty pipeline stage")
+        return
+
+    filters = []
+    for st in stages[1:]:
+        fn = pipe_filter(st[0])
+        if not fn:
+            printer("Not a pipeline stage:", st[0])
+            return
+        filters.append((fn, st[1:]))
+
+    out = []  # hedef dosya: ilk satırda açılır, aşama hatası onu boşaltmaz
+    errors = []
+    try:
+        if target:
+            def push(line):
+                if line is None: return
+                if not out: out.append(open(target, mode, encoding="utf-8"))
+                out[0].write(line + "\n")
+        else:
+            def push(line):
+                if line is not None: printer(line)
+
+        for fn, args in reversed(filters):
+            push = PipeStage(fn, args, push, errors)
+        if errors:
+            printer("Pipe error:", errors[0])
+            return
+
+        sink = LineSink(push)
+        result = shell_exec(" ".join(stages[0]), sink)
+        sink.close()
+        if target and not out:
+            out.append(open(target, mode, encoding="utf-8"))  # boş çıktı
+        for e in errors:
+            printer("Pipe error:", e)
+        return result
+    finally:
+        if out:
+            out[0].close()
+            fs_invalidate(target)
+        if [st for st in stages[1:] if st[0] not in PIPE_FILTERS]:
+            fs_cache_clear()  # plugin aşamaları dosya yazmış olabilir
 
 # ================= Shell =================
 def shell_exec(cmd, printer=print):
@@ -576,7 +1365,10 @@ def shell_exec(cmd, printer=print):
     if not parts: return
     c, args = parts[0], parts[1:]
     try:     
-        if shell_pkg_command(c, args):
+        if "|" in parts or ">" in parts or ">>" in parts:
+            return run_pipeline(parts, printer)
+
+        elif shell_pkg_command(c, args, printer):
             return
         
         elif c == "help":
@@ -591,13 +1383,23 @@ def shell_exec(cmd, printer=print):
         blink <n> [delay]      - blink LED n times, optional delay
         ram                    - show free RAM
         reboot                 - reboot ESP32
+        update [url]           - OTA update from release manifest (auto rollback)
+        version                - show installed release
         exit                   - exit shell
         flash                  - show total/free flash
         uptime                 - show how long ESP32 has been running
         ip                     - show WiFi IP
-        ping <host>            - ping host/domain
+        ping [-c N] [-p port] <host>  - TCP connect RTT stats + DNS timing
+        netbench <host> [-p port] [-b 512,1024] [-n KB]  - throughput test
+                               against tools/netbench_server.py (port 5210)
         download <url> <file>  - download file from URL
+        netshell [port]        - start telnet shell server (default 23)
+        netshell status        - list network shell sessions
+                               (commands run one at a time: a long command
+                               blocks every session; number_game/netbench
+                               are refused, ping/blink are capped at 5)
         number_game            - play number guessing game
+        run <script.py> [args] - run Python script (cached, isolated)
 
         GPIO & PWM:
         gpio <pin> <0|1>       - set GPIO pin output
@@ -617,50 +1419,81 @@ def shell_exec(cmd, printer=print):
         append <filename> <content>   - append content
         read <filename>        - read file
         delete <filename>      - delete file
+        gzip <file>            - compress file to <file>.gz
+        gunzip <file.gz>       - decompress .gz file
+        zbench <file>          - compare plain vs compressed size/load time
         mv <src> <dest>        - move file
         cp <src> <dest>        - copy file
-        ls                     - list files
+        ls [-l] [dir]          - list files (-l: type and size)
+        du [dir]               - total size of directory
+        find <pattern> [dir]   - find files by name (* and ?)
         cd <dir>               - change directory
         pwd                    - show current directory
         mkdir <dir>            - make directory
         rmdir <dir>            - remove directory
         
+        Pipelines (operators need spaces around them):
+        cmd | grep [-v] [-i] <text>   - filter lines
+        cmd | head [-n N] / tail [-n N]
+        cmd | wc [-l] / sort [-r] [-n]
+        cmd > file / cmd >> file      - write / append output to file
+        plugins with pipe(args, printer) can be stages too
+
         time                 - show RTC time
         time-sync            - sync time over HTTP
 
         """)
         
-        elif c == "ls": ls()
+        elif c == "ls": ls(args, printer)
+        
+        elif c == "du": du(args[0] if args else "", printer)
+        
+        elif c == "find" and args: find(args[0], args[1] if len(args)>1 else "", printer)
         
         elif c == "cd" and args: cd(args[0])
         
-        elif c == "pwd": pwd()
+        elif c == "pwd": pwd(printer)
         
         elif c == "freq":
             if not args: printer(machine.freq(), "Hz")
-            elif args[0] == "set" and len(args)>1: freq_change(int(args[1]))
+            elif args[0] == "set" and len(args)>1: freq_change(int(args[1]), printer)
         
         
-        elif c == "gpio" and len(args)==2: gpio(args[0], args[1])
+        elif c == "gpio" and len(args)==2: gpio(args[0], args[1], printer)
         
-        elif c == "run": cmd_run([c] + args)
+        elif c == "run": cmd_run([c] + args, printer)
 
         
-        elif c == "pwm" and len(args)==3: pwm(args[0], args[1], args[2])
+        elif c == "pwm" and len(args)==3: pwm(args[0], args[1], args[2], printer)
+        
+        elif c == "mv" and len(args)==2: mv(args[0], args[1], printer)
         
-        elif c == "mv" and len(args)==2: mv(args[0], args[1])
+        elif c == "cp" and len(args)==2: cp(args[0], args[1], printer)
         
-        elif c == "cp" and len(args)==2: cp(args[0], args[1])
+        elif c == "mkdir" and args: mkdir(args[0], printer)
         
-        elif c == "mkdir" and args: mkdir(args[0])
+        elif c == "rmdir" and args: rmdir(args[0], printer)
         
-        elif c == "rmdir" and args: rmdir(args[0])
+        elif c == "ping" and args:
+            opts, rest = parse_opts(args, ("-c", "-p"))
+            if not rest: printer("Usage: ping [-c N] [-p port] <host>")
+            else: ping(rest[0], int(opts.get("-c", 4)), int(opts.get("-p", 80)), printer)
         
-        elif c == "ping" and args: ping(args[0])
+        elif c == "netbench" and args:
+            opts, rest = parse_opts(args, ("-p", "-b", "-n"))
+            if not rest: printer("Usage: netbench <host> [-p port] [-b 512,1024] [-n KB]")
+            else: netbench(rest[0], int(opts.get("-p", NETBENCH_PORT)),
+                           [int(b) for b in opts.get("-b", "1024").split(",")],
+                           int(opts.get("-n", 64)), printer)
         
-        elif c == "ip": ip()
+        elif c == "ip": ip(printer)
         
-        elif c == "download" and len(args)==2: download(args[0], args[1])
+        elif c == "download" and len(args)==2: download(args[0], args[1], printer)
+        
+        elif c == "netshell":
+            if args and args[0] == "status": net_shell_status(printer)
+            elif args: net_shell_start(int(args[0]), printer)
+            else: net_shell_start(printer=printer)
         
         elif c == "number_game": number_game()
         
@@ -682,9 +1515,9 @@ def shell_exec(cmd, printer=print):
         elif c == "wifi":
             if args[0]=="on": wifi_on()
             elif args[0]=="off": wifi_off()
-            elif args[0]=="connect" and len(args)>=2: wifi_connect(args[1], args[2])
+            elif args[0]=="connect" and len(args)>=2: wifi_connect(args[1], args[2], printer)
         
-        elif c == "weather" and args: get_weather(args[0])
+        elif c == "weather" and args: get_weather(args[0], printer)
         
         elif c == "blink":
             if len(args)==2: blink(int(args[0]), float(args[1]))
@@ -692,19 +1525,29 @@ def shell_exec(cmd, printer=print):
         
         elif c == "ram": clean_ram(); printer("Free RAM:", gc.mem_free())
         
-        elif c == "create" and args: create_file(args[0])
+        elif c == "create" and args: create_file(args[0], printer)
+        
+        elif c == "write" and len(args)>=2: write_file(args[0], " ".join(args[1:]), printer)
+        
+        elif c == "append" and len(args)>=2: append_file(args[0], " ".join(args[1:]), printer)
         
-        elif c == "write" and len(args)>=2: write_file(args[0], " ".join(args[1:]))
+        elif c == "read" and args: read_file(args[0], printer)
         
-        elif c == "append" and len(args)>=2: append_file(args[0], " ".join(args[1:]))
+        elif c == "delete" and args: delete_file(args[0], printer)
         
-        elif c == "read" and args: read_file(args[0])
+        elif c == "gzip" and args: gzip_file(args[0], printer)
         
-        elif c == "delete" and args: delete_file(args[0])
+        elif c == "gunzip" and args: gunzip_file(args[0], printer)
+        
+        elif c == "zbench" and args: zbench(args[0], printer)
         
         elif c == "reboot": reboot()
         
-        elif c == "flash": flash_info()
+        elif c == "update": update(args[0] if args else UPDATE_URL, printer)
+        
+        elif c == "version": printer("Version:", current_version() or "unknown")
+        
+        elif c == "flash": flash_info(printer)
         
         elif c == "exit": printer("Bye 👋"); return "exit"
         
@@ -721,13 +1564,179 @@ def shell_exec(cmd, printer=print):
 
 
 def shell():
+    update_confirm()
     print("ESP32 Shell ready. Type 'help'")
     while True:
         cmd = input("esp@esp32 > ").strip()
         if not cmd: continue
-        result = shell_exec(cmd)
+        with EXEC_LOCK:
+            result = shell_exec(cmd)
         if result=="exit": break
 
+# ================= Network Shell =================
+
+import uasyncio as asyncio
+
+NET_SHELL_PORT = 23
+NET_SHELL_BUF = 512  # bytes buffered per session before a socket write
+NET_SESSIONS = []
+NET_INTERACTIVE = ("number_game",)  # input() bekler, seri konsolu kilitler
+# komutlar event-loop thread'inde EXEC_LOCK altında sırayla çalışır:
+# uzun bir komut tüm oturumları dondurur, o yüzden ağdan sınırlanır
+NET_LONG = ("netbench",)
+NET_MAX_PING = 5
+NET_MAX_BLINK = 5
+EXEC_LOCK = _thread.allocate_lock()
+net_shell_port = None
+
+
+class NetSession:
+    def __init__(self, writer, addr):
+        self.writer = writer
+        self.addr = addr
+        self.vars = {}
+        self.cwd = os.getcwd()
+        self.buf = []
+        self.size = 0
+
+    # print() uyumlu printer, çıktıyı tek soket yazımında toplar
+    def printer(self, *args, sep=" ", end="\n"):
+        s = sep.join([str(a) for a in args]) + end
+        self.buf.append(s)
+        self.size += len(s)
+        if self.size >= NET_SHELL_BUF:
+            self.flush()
+
+    def flush(self):
+        if not self.buf:
+            return
+        data = "".join(self.buf).replace("\n", "\r\n")
+        self.buf = []
+        self.size = 0
+        self.writer.write(data.encode())
+
+
+def telnet_clean(data):
+    # IAC (0xFF) komutlarını ve satır sonlarını at
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        b = data[i]
+        if b == 0xFF:
+            i += 3
+            continue
+        if b not in (0x00, 0x0A, 0x0D):
+            out.append(b)
+        i += 1
+    return bytes(out).decode()
+
+
+def net_check(parts):
+    # pipeline'daki her aşamanın komutunu kontrol et, sorun varsa mesaj döner
+    stages = [[]]
+    for p in parts:
+        if p == "|": stages.append([])
+        else: stages[-1].append(p)
+    for st in stages:
+        if not st: continue
+        c, args = st[0], st[1:]
+        if c in NET_INTERACTIVE:
+            return "Interactive command not available over netshell: " + c
+        if c in NET_LONG:
+            return "Long-running command not available over netshell: " + c
+        try:
+            if c == "ping" and int(parse_opts(args, ("-c",))[0].get("-c", 4)) > NET_MAX_PING:
+                return "ping over netshell is limited to -c {}".format(NET_MAX_PING)
+            if c == "blink" and args and int(args[0]) > NET_MAX_BLINK:
+                return "blink over netshell is limited to {} times".format(NET_MAX_BLINK)
+        except ValueError:
+            pass  # komutun kendisi hatayı bildirir
+
+
+def session_exec(session, cmd):
+    global SHELL_VARS
+    msg = net_check(cmd.split())
+    if msg:
+        session.printer(msg)
+        return
+    with EXEC_LOCK:
+        saved_vars, saved_cwd = SHELL_VARS, os.getcwd()
+        SHELL_VARS = session.vars
+        try:
+            try:
+                os.chdir(session.cwd)
+            except OSError:
+                # klasörü başka bir oturum silmiş olabilir
+                session.printer("cwd {} is gone, switched to /".format(session.cwd))
+                session.cwd = "/"
+                os.chdir("/")
+            result = shell_exec(cmd, session.printer)
+            session.cwd = os.getcwd()
+        finally:
+            SHELL_VARS = saved_vars
+            try: os.chdir(saved_cwd)
+            except OSError: os.chdir("/")
+    return result
+
+
+async def net_client(reader, writer):
+    addr = writer.get_extra_info("peername")
+    session = NetSession(writer, addr)
+    NET_SESSIONS.append(session)
+    print("[netshell] connected:", addr)
+    try:
+        session.printer("ESP32 Shell ready. Type 'help'")
+        while True:
+            session.printer("esp@esp32 > ", end="")
+            session.flush()
+            await writer.drain()
+
+            line = await reader.readline()
+            if not line: break
+            cmd = telnet_clean(line).strip()
+            if not cmd: continue
+
+            if session_exec(session, cmd) == "exit":
+                session.flush()
+                await writer.drain()
+                break
+    except Exception as e:
+        print("[netshell] session error:", e)
+    finally:
+        NET_SESSIONS.remove(session)
+        writer.close()
+        await writer.wait_closed()
+        print("[netshell] disconnected:", addr)
+
+
+async def net_serve(port):
+    await asyncio.start_server(net_client, "0.0.0.0", port)
+    while True:
+        await asyncio.sleep(3600)
+
+
+def net_shell_start(port=NET_SHELL_PORT, printer=print):
+    global net_shell_port
+    if net_shell_port:
+        printer("[netshell] already running on port", net_shell_port)
+        return
+    if not wlan.isconnected():
+        printer("WiFi not connected")
+        return
+
+    net_shell_port = port
+    _thread.start_new_thread(asyncio.run, (net_serve(port),))
+    printer("[netshell] listening on {}:{}".format(wlan.ifconfig()[0], port))
+
+
+def net_shell_status(printer=print):
+    if not net_shell_port:
+        printer("[netshell] not running")
+        return
+    printer("[netshell] port", net_shell_port, "-", len(NET_SESSIONS), "session(s)")
+    for s in NET_SESSIONS:
+        printer("-", s.addr, s.cwd)
+
 # ================= Boot main =================
 
 if "pkg" not in os.listdir():
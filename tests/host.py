@@ -0,0 +1,38 @@
+# MicroPython stub'ları ile main.py'yi Linux'ta yükler
+import gc
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubs"))
+
+time.ticks_ms = lambda: int(time.monotonic() * 1000)
+time.ticks_us = lambda: int(time.monotonic() * 1000000)
+time.ticks_diff = lambda a, b: a - b
+gc.mem_free = lambda: 100000
+
+
+def ilistdir(path="."):
+    for e in os.scandir(path):
+        yield (e.name, 0x4000 if e.is_dir() else 0x8000, 0, -1 if e.is_dir() else e.stat().st_size)
+
+os.ilistdir = ilistdir
+
+
+def load_main():
+    # boot kısmı (shell() input bekler) hariç main.py
+    with open(os.path.join(ROOT, "main.py")) as f:
+        src = f.read().split("# ================= Boot main")[0]
+    env = {"__name__": "espos"}
+    exec(compile(src, "main.py", "exec"), env)
+    return env
+
+
+def load_boot():
+    # boot.py'nin fonksiyonları, en üst seviye çağrılar olmadan
+    with open(os.path.join(ROOT, "boot.py")) as f:
+        src = f.read().split("\nupdate_check()")[0]
+    env = {"__name__": "boot"}
+    exec(compile(src, "boot.py", "exec"), env)
+    return env
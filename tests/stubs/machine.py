@@ -0,0 +1,19 @@
+class Pin:
+    OUT = 1
+    def __init__(self, *args): pass
+    def value(self, *args): pass
+
+class PWM:
+    def __init__(self, *args): pass
+
+class RTC:
+    def datetime(self, *args): return (2000, 1, 1, 0, 0, 0, 0, 0)
+
+class Timer:
+    ONE_SHOT = 0
+    def __init__(self, *args): pass
+    def init(self, **kwargs): pass
+    def deinit(self): pass
+
+def freq(*args): return 160000000
+def reset(): raise SystemExit("machine.reset()")
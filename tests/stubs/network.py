@@ -0,0 +1,8 @@
+STA_IF = 0
+
+class WLAN:
+    def __init__(self, *args): pass
+    def active(self, *args): return True
+    def connect(self, *args): pass
+    def isconnected(self): return True
+    def ifconfig(self): return ("127.0.0.1", "255.0.0.0", "127.0.0.1", "127.0.0.1")
@@ -0,0 +1 @@
+def settime(): pass
@@ -0,0 +1 @@
+from asyncio import *
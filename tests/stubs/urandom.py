@@ -0,0 +1 @@
+from random import getrandbits
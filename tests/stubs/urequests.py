@@ -0,0 +1,20 @@
+import json
+import urllib.error
+import urllib.request
+
+class Response:
+    def __init__(self, url):
+        try:
+            self.raw = urllib.request.urlopen(url)
+            self.status_code = self.raw.status
+        except urllib.error.HTTPError as e:
+            self.raw = e
+            self.status_code = e.code
+
+    @property
+    def text(self): return self.raw.read().decode()
+    def json(self): return json.loads(self.raw.read())
+    def close(self): self.raw.close()
+
+def get(url):
+    return Response(url)
@@ -0,0 +1,10 @@
+import socket as _socket
+from socket import *
+
+
+class socket(_socket.socket):
+    # MicroPython soket metodları
+    def readinto(self, buf): return self.recv_into(buf)
+    def write(self, buf):
+        self.sendall(buf)
+        return len(buf)
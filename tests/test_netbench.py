@@ -0,0 +1,50 @@
+# ping ve netbench, tools/netbench_server.py'ye karşı
+import os
+import socket
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host
+
+sys.path.insert(0, os.path.join(host.ROOT, "tools"))
+import netbench_server
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def run(main, cmd):
+    out = []
+    main["shell_exec"](cmd, lambda *a, sep=" ", end="\n": out.append(sep.join(map(str, a)) + end))
+    return "".join(out)
+
+
+def test_ping_and_netbench():
+    main = host.load_main()
+    port = free_port()
+    ready = threading.Event()
+    threading.Thread(target=netbench_server.serve, args=(port, ready), daemon=True).start()
+    ready.wait(5)
+
+    out = run(main, "ping -c 3 -p %d 127.0.0.1" % port)
+    assert "3 sent, 3 ok, 0% loss" in out, out
+    assert "rtt min/avg/max/jitter" in out, out
+    assert "count must be >= 1" in run(main, "ping -c 0 127.0.0.1")
+    assert "Usage: ping" in run(main, "ping -c 5")
+
+    out = run(main, "netbench 127.0.0.1 -p %d -b 512,4096 -n 128" % port)
+    assert out.count("131072 bytes in") == 4, out
+    assert "Usage: netbench" in run(main, "netbench -n 5")
+    assert "must be >= 1" in run(main, "netbench 127.0.0.1 -p %d -b 0" % port)
+    assert "must be >= 1" in run(main, "netbench 127.0.0.1 -p %d -n 0" % port)
+
+
+if __name__ == "__main__":
+    test_ping_and_netbench()
+    print("ok")
@@ -0,0 +1,100 @@
+# Çok istemcili netshell yük testi: python tests/test_netshell_load.py veya pytest
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host
+
+CLIENTS = 20
+PROMPT = b"esp@esp32 > "
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+async def command(reader, writer, cmd):
+    writer.write(cmd.encode() + b"\r\n")
+    await writer.drain()
+    return await reader.readuntil(PROMPT)
+
+
+async def client(port, i):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await reader.readuntil(PROMPT)
+    out = b""
+    for cmd in ("mkdir d%d" % i, "cd d%d" % i, "pwd", "write f.txt hello%d" % i,
+                "read f.txt", "mkdir tmp", "rmdir tmp", "ls", "number_game"):
+        out += await command(reader, writer, cmd)
+    writer.write(b"exit\r\n")
+    await writer.drain()
+    out += await reader.read()
+    writer.close()
+
+    assert b"/d%d\r\n" % i in out, out
+    assert b"hello%d" % i in out, out
+    assert b"Directory 'tmp' removed" in out, out
+    assert b"['f.txt']" in out, out
+    assert b"not available over netshell" in out, out
+    assert b"Bye" in out, out
+
+
+async def load(port):
+    for _ in range(50):
+        try:
+            r, w = await asyncio.open_connection("127.0.0.1", port)
+            w.close()
+            break
+        except OSError:
+            await asyncio.sleep(0.1)
+    await asyncio.gather(*[client(port, i) for i in range(CLIENTS)])
+
+
+async def removed_cwd(port):
+    r1, w1 = await asyncio.open_connection("127.0.0.1", port)
+    r2, w2 = await asyncio.open_connection("127.0.0.1", port)
+    await r1.readuntil(PROMPT)
+    await r2.readuntil(PROMPT)
+    await command(r1, w1, "mkdir gone")
+    await command(r1, w1, "cd gone")
+    await command(r2, w2, "rmdir gone")
+    out = await command(r1, w1, "pwd")
+    assert b"is gone, switched to /" in out, out
+    out = await command(r1, w1, "ping -c 50 127.0.0.1")
+    assert b"limited to -c 5" in out, out
+    out = await command(r1, w1, "netbench 127.0.0.1")
+    assert b"Long-running command not available" in out, out
+    w1.close()
+    w2.close()
+
+
+def test_netshell_load():
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        main = host.load_main()
+        port = free_port()
+        main["net_shell_start"](port)
+        t = time.monotonic()
+        asyncio.run(load(port))
+        asyncio.run(removed_cwd(port))
+        print("{} clients in {:.2f} s".format(CLIENTS, time.monotonic() - t))
+        for _ in range(50):
+            if not main["NET_SESSIONS"]: break
+            time.sleep(0.05)
+        assert main["NET_SESSIONS"] == []
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_netshell_load()
+    print("ok")
@@ -0,0 +1,60 @@
+# | ve > ile pipeline'lar
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host
+
+UPPER = """
+def fix(l): return l.upper()
+def pipe(args, printer):
+    while True:
+        l = yield
+        if l is None: return
+        printer(fix(l))
+"""
+
+
+def run(main, cmd):
+    out = []
+    main["shell_exec"](cmd, lambda *a, sep=" ", end="\n": out.append(sep.join(map(str, a)) + end))
+    return "".join(out)
+
+
+def test_pipeline():
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        main = host.load_main()
+        main["PLUGINS"]["up"] = UPPER
+        main["PLUGINS"]["other"] = "def main(args, printer): printer('other')\n"
+        main["PLUGINS"]["bad"] = ("def pipe(args, printer):\n    l = yield\n"
+                                  "    printer(l)\n    int('x')\n")
+        with open("a.txt", "w") as f: f.write("b\na\nc\n")
+
+        assert run(main, "read a.txt") == "b\na\nc\n"
+        assert run(main, "read a.txt | head -n 0") == ""
+        assert run(main, "read a.txt | wc -l") == "3\n"
+        assert run(main, "read a.txt | grep -v a | sort -r") == "c\nb\n"
+        assert run(main, "read a.txt | sort | up | tail -n 2") == "B\nC\n"
+        assert "Not a pipeline stage: other" in run(main, "read a.txt | other")
+
+        run(main, "read a.txt | head -n 1 > out.txt")
+        run(main, "read a.txt | tail -n 1 >> out.txt")
+        assert run(main, "read out.txt") == "b\nc\n"
+
+        out = run(main, "read a.txt | bad")
+        assert out.startswith("b\nPipe error: invalid literal"), out
+        out = run(main, "read a.txt | head -n zz > out.txt")
+        assert "Pipe error" in out, out
+        assert run(main, "read out.txt") == "b\nc\n"
+        run(main, "read a.txt | grep nothing > out.txt")
+        assert run(main, "read out.txt") == "\n"
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_pipeline()
+    print("ok")
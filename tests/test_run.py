@@ -0,0 +1,38 @@
+# run: iç içe çalıştırma ve espos modülü
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host
+
+
+def run(main, cmd):
+    out = []
+    main["shell_exec"](cmd, lambda *a, sep=" ", end="\n": out.append(sep.join(map(str, a)) + end))
+    return "".join(out)
+
+
+def test_nested_run():
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        main = host.load_main()
+        with open("outer.py", "w") as f:
+            f.write("import espos\nespos.shell('run inner.py x')\nimport espos as again\n"
+                    "print('outer', again.argv)\n")
+        with open("inner.py", "w") as f:
+            f.write("import espos\nprint('inner', espos.argv)\n")
+
+        out = run(main, "run outer.py a")
+        assert "inner ['inner.py', 'x']" in out, out
+        assert "outer ['outer.py', 'a']" in out, out
+        assert "Error" not in out, out
+        assert "espos" not in sys.modules
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_nested_run()
+    print("ok")
@@ -0,0 +1,114 @@
+# OTA update: yerel http.server'a karşı, UPDATE_ROOT geçici klasörde
+import functools
+import hashlib
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host
+
+
+def serve(files, manifest):
+    srv_dir = tempfile.mkdtemp()
+    for name, data in files.items():
+        with open(os.path.join(srv_dir, name), "w") as f: f.write(data)
+    with open(os.path.join(srv_dir, "manifest.json"), "w") as f: json.dump(manifest, f)
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=srv_dir)
+    handler.log_message = lambda *a: None
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, "http://127.0.0.1:%d/" % srv.server_address[1]
+
+
+def release(files, version="2.0", bad=()):
+    entries = []
+    for name, data in files.items():
+        sha = hashlib.sha256(data.encode()).hexdigest()
+        entries.append({"name": name, "sha256": "0" * 64 if name in bad else sha})
+    return serve(files, {"version": version, "files": entries})
+
+
+def device():
+    root = tempfile.mkdtemp() + "/"
+    for name in ("main.py", "boot.py"):
+        with open(root + name, "w") as f: f.write("old " + name)
+    main = host.load_main()
+    boot = host.load_boot()
+    main["UPDATE_ROOT"] = boot["UPDATE_ROOT"] = root
+    main["reboot"] = lambda: None
+    return root, main, boot
+
+
+def read(path):
+    with open(path) as f: return f.read()
+
+
+def boot_check(boot):
+    try:
+        boot["update_check"]()
+    except SystemExit:
+        return "reset"
+
+
+NEW = {"main.py": "new main.py", "extra.py": "new extra.py"}
+
+
+def test_sha256_mismatch_keeps_release():
+    root, main, boot = device()
+    srv, url = release(NEW, bad=("extra.py",))
+    main["update"](url)
+    srv.shutdown()
+    assert read(root + "main.py") == "old main.py"
+    assert sorted(os.listdir(root)) == ["boot.py", "main.py"]
+
+
+def test_swap_and_confirm():
+    root, main, boot = device()
+    srv, url = release(NEW)
+    main["update"](url)
+    srv.shutdown()
+    assert read(root + "update.state").split("\n")[0] == "pending"
+    assert read(root + "main.py") == "new main.py"
+
+    assert boot_check(boot) is None
+    assert read(root + "update.state").split("\n")[0] == "trial"
+    main["update_confirm"]()
+    assert sorted(os.listdir(root)) == ["boot.py", "extra.py", "main.py", "version.txt"]
+    assert main["current_version"]() == "2.0"
+
+
+def test_trial_rollback():
+    root, main, boot = device()
+    srv, url = release(NEW)
+    main["update"](url)
+    srv.shutdown()
+    boot_check(boot)
+    # yeni main.py prompt'a ulaşamadı, zamanlayıcı reset attı
+    assert boot_check(boot) == "reset"
+    assert sorted(os.listdir(root)) == ["boot.py", "main.py"]
+    assert read(root + "main.py") == "old main.py"
+
+
+def test_interrupted_swap_rolls_back():
+    root, main, boot = device()
+    # main.py swap edildi, boot.py henüz değil, extra.py hiç gelmedi
+    os.rename(root + "main.py", root + "main.py.bak")
+    with open(root + "main.py", "w") as f: f.write("new main.py")
+    with open(root + "update.state", "w") as f:
+        f.write("swapping\n2.0\nmain.py\nboot.py\n+extra.py")
+    assert boot_check(boot) == "reset"
+    assert sorted(os.listdir(root)) == ["boot.py", "main.py"]
+    assert read(root + "main.py") == "old main.py"
+    assert read(root + "boot.py") == "old boot.py"
+
+
+if __name__ == "__main__":
+    test_sha256_mismatch_keeps_release()
+    test_swap_and_confirm()
+    test_trial_rollback()
+    test_interrupted_swap_rolls_back()
+    print("ok")
@@ -0,0 +1,46 @@
+# netbench karşı sunucusu (PC'de çalışır): python tools/netbench_server.py [port]
+#   "down N\n" -> N byte gönderir
+#   "up N\n"   -> N byte okur, sonra "ok <okunan>\n" ile onaylar
+import socket
+import sys
+import threading
+
+PORT = 5210
+
+
+def handle(conn):
+    with conn:
+        f = conn.makefile("rb")
+        line = f.readline().split()
+        if len(line) != 2:
+            return
+        mode, n = line[0], int(line[1])
+        if mode == b"down":
+            chunk = b"x" * 4096
+            while n > 0:
+                conn.sendall(chunk[:n])
+                n -= len(chunk)
+        elif mode == b"up":
+            got = 0
+            while got < n:
+                data = f.read1(65536)
+                if not data: break
+                got += len(data)
+            conn.sendall(b"ok %d\n" % got)
+
+
+def serve(port=PORT, ready=None):
+    srv = socket.socket()
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(("0.0.0.0", port))
+    srv.listen(8)
+    if ready: ready.set()
+    while True:
+        conn, addr = srv.accept()
+        threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    print("netbench server on port", port)
+    serve(port)